@@ -2,24 +2,14 @@
 
 import os
 from pathlib import Path
+from functools import lru_cache
+from dataclasses import dataclass
 from dotenv import load_dotenv
 
-# Load .env from project root (parent of backend/)
-env_path = Path(__file__).parent.parent.parent / ".env"
-load_dotenv(env_path, override=True)
-
-# Debug prints (remove after testing)
-print(f"ENV PATH: {env_path}")
-print(f"ENV EXISTS: {env_path.exists()}")
-print(f"VOYAGE KEY: '{os.getenv('VOYAGE_API_KEY')}'")
-
-# Required
-VOYAGE_API_KEY = os.getenv("VOYAGE_API_KEY")
-DATABASE_URL = os.getenv("DATABASE_URL")
-GROQ_API_KEY = os.getenv("GROQ_API_KEY")
-
-# Optional (for custom model)
-MODAL_URL = os.getenv("MODAL_URL", "")
+# Load .env from project root (parent of backend/) exactly once per process
+if os.getenv("_ENV_LOADED") != "1":
+    load_dotenv(Path(__file__).parent.parent.parent / ".env", override=True)
+    os.environ["_ENV_LOADED"] = "1"
 
 # Groq settings
 GROQ_MODEL_NAME = "llama-3.3-70b-versatile"
@@ -27,17 +17,42 @@ GROQ_TEMPERATURE = 0.2
 GROQ_MAX_TOKENS = 300
 
 
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Immutable application settings, read from the environment once."""
+    voyage_api_key: str
+    database_url: str
+    groq_api_key: str
+    modal_url: str
+    groq_model_name: str = GROQ_MODEL_NAME
+    groq_temperature: float = GROQ_TEMPERATURE
+    groq_max_tokens: int = GROQ_MAX_TOKENS
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Build the settings object once; callers read cached attributes."""
+    return Settings(
+        voyage_api_key=os.getenv("VOYAGE_API_KEY", ""),
+        database_url=os.getenv("DATABASE_URL", ""),
+        groq_api_key=os.getenv("GROQ_API_KEY", ""),
+        modal_url=os.getenv("MODAL_URL", "")
+    )
+
+
 def validate_config():
     """Check required environment variables."""
+    settings = get_settings()
+
     missing = []
-    if not VOYAGE_API_KEY:
+    if not settings.voyage_api_key:
         missing.append("VOYAGE_API_KEY")
-    if not DATABASE_URL:
+    if not settings.database_url:
         missing.append("DATABASE_URL")
-    if not GROQ_API_KEY:
+    if not settings.groq_api_key:
         missing.append("GROQ_API_KEY")
-    
+
     if missing:
         raise ValueError(f"Missing environment variables: {', '.join(missing)}")
-    
-    return True
\ No newline at end of file
+
+    return True
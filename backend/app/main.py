@@ -1,27 +1,39 @@
 """FastAPI application for Quantum Computing LLM."""
 
+import re
 import sys
 import time
+import asyncio
+import hashlib
 import logging
 from pathlib import Path
 from typing import Optional, List
 from contextlib import asynccontextmanager
-from difflib import SequenceMatcher
 
-from fastapi import FastAPI, HTTPException, Response
+import orjson
+import numpy as np
+from cachetools import LRUCache
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
 
+try:
+    from rapidfuzz import fuzz, process, utils
+except ImportError:
+    fuzz = None
+
 # Add scripts to path
 SCRIPTS_PATH = Path(__file__).parent.parent / "scripts"
 sys.path.insert(0, str(SCRIPTS_PATH))
 
+if fuzz is None:
+    from _fast_difflib import FastSequenceMatcher
+
 from retrieval import Retriever
 from groq_inference import GroqInference
 from modal_inference import ModalInference
-from app.config import (
-    GROQ_API_KEY, GROQ_MODEL_NAME, GROQ_TEMPERATURE, GROQ_MAX_TOKENS,
-    MODAL_URL, validate_config
-)
+from semantic_cache import SemanticCache
+from app.config import get_settings, validate_config
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -30,17 +42,26 @@ logger = logging.getLogger(__name__)
 retriever: Optional[Retriever] = None
 groq_inference: Optional[GroqInference] = None
 modal_inference: Optional[ModalInference] = None
+semantic_cache = SemanticCache()
+
+# HTTP-level cache: identical (model, question) pairs get 304s / cached bodies
+etag_cache: LRUCache = LRUCache(maxsize=256)
+CACHE_CONTROL = "private, max-age=300"
+
+# In-flight pipelines keyed by ETag; duplicates await the same future
+inflight: dict = {}
 
 
 def get_groq() -> GroqInference:
     """Lazy initialization for Groq client."""
     global groq_inference
     if groq_inference is None:
+        settings = get_settings()
         groq_inference = GroqInference(
-            api_key=GROQ_API_KEY,
-            model=GROQ_MODEL_NAME,
-            temperature=GROQ_TEMPERATURE,
-            max_tokens=GROQ_MAX_TOKENS
+            api_key=settings.groq_api_key,
+            model=settings.groq_model_name,
+            temperature=settings.groq_temperature,
+            max_tokens=settings.groq_max_tokens
         )
     return groq_inference
 
@@ -48,14 +69,22 @@ def get_groq() -> GroqInference:
 def get_modal() -> Optional[ModalInference]:
     """Lazy initialization for Modal client."""
     global modal_inference
-    if modal_inference is None and MODAL_URL:
-        modal_inference = ModalInference(url=MODAL_URL)
+    modal_url = get_settings().modal_url
+    if modal_inference is None and modal_url:
+        modal_inference = ModalInference(url=modal_url)
     return modal_inference
 
 
+# Words of 6+ letters carry the topical signal for follow-up matching
+WORD_RE = re.compile(r"[a-z]{6,}")
+
+
 def text_similarity(a: str, b: str) -> float:
     """Calculate text similarity ratio."""
-    return SequenceMatcher(None, a.lower(), b.lower()).ratio()
+    if fuzz is not None:
+        return fuzz.ratio(a, b, processor=utils.default_process) / 100.0
+    # autojunk=False skips the junk branch entirely for short questions
+    return FastSequenceMatcher(None, a.lower(), b.lower(), autojunk=False).ratio()
 
 
 def get_suggested_question(original: str, answer: str, results: List[dict]) -> Optional[str]:
@@ -63,34 +92,89 @@ def get_suggested_question(original: str, answer: str, results: List[dict]) -> O
     if not results:
         return None
     
-    answer_words = set(
-        w.lower().strip(".,!?()[]{}:;\"'") 
-        for w in answer.split() 
-        if len(w) > 5
-    )
-    candidates = []
-    
-    for r in results:
-        q = r.get("question", "").strip()
-        if not q:
-            continue
-        sim = text_similarity(original, q)
-        if sim > 0.6:
-            continue
-        matches = sum(1 for w in answer_words if w in q.lower())
-        candidates.append({"question": q, "similarity": sim, "matches": matches})
-    
-    if not candidates:
+    answer_set = set(WORD_RE.findall(answer.lower()))
+    questions = [r.get("question", "").strip() for r in results]
+
+    # Score all candidates against the original in one vectorized call
+    if fuzz is not None:
+        sims = process.cdist(
+            [original], questions,
+            scorer=fuzz.ratio, processor=utils.default_process
+        )[0] / 100.0
+    else:
+        sims = np.array([text_similarity(original, q) for q in questions])
+
+    matches = np.empty(len(results), dtype=np.int64)
+    for i, (r, q) in enumerate(zip(results, questions)):
+        q_set = r.get("question_words")
+        if q_set is None:
+            q_set = r["question_words"] = set(WORD_RE.findall(q.lower()))
+        matches[i] = len(answer_set & q_set)
+
+    # Mask out empty questions and near-duplicates of the original
+    valid = np.array([bool(q) for q in questions]) & (sims <= 0.6)
+    if not valid.any():
         return None
-    
-    candidates.sort(key=lambda x: (-x["matches"], x["similarity"]))
-    return candidates[0]["question"]
+
+    # Same ordering as sorting by (-matches, similarity): most shared
+    # answer words first, lowest similarity breaking ties
+    sims = np.where(valid, sims, np.inf)
+    matches = np.where(valid, matches, -1)
+    best = int(np.lexsort((sims, -matches))[0])
+    return questions[best]
 
 
-def build_context(results: List[dict], top_k: int = 3) -> str:
-    """Build context string from retrieved results."""
-    parts = [f"Q: {r['question']} A: {r['answer'][:300]}" for r in results[:top_k]]
-    return " ".join(parts)
+def select_model(model_name: str):
+    """Resolve the requested model to an inference client."""
+    if model_name == "custom":
+        modal = get_modal()
+        if not modal:
+            raise HTTPException(status_code=400, detail="Custom model not configured")
+        logger.info("Using Custom Model (Modal)")
+        return modal, "custom"
+    logger.info("Using Groq")
+    return get_groq(), "groq"
+
+
+async def get_query_embedding(question: str) -> List[float]:
+    """Embed a question, reusing the cached embedding for exact repeats."""
+    embedding = semantic_cache.get_embedding(question)
+    if embedding is None:
+        embedding = await retriever.embed_query(question)
+        semantic_cache.put_embedding(question, embedding)
+    return embedding
+
+
+def make_etag(model: str, question: str) -> str:
+    """Compute a stable ETag for a (model, question) pair."""
+    key = f"{model}:{question.strip().lower()}".encode()
+    return hashlib.blake2b(key, digest_size=16).hexdigest()
+
+
+def sse_event(payload: dict) -> str:
+    """Format a payload as a server-sent event."""
+    return f"data: {orjson.dumps(payload).decode()}\n\n"
+
+
+# Seeds the embedding cache at boot and exercises every external hop
+WARMUP_QUESTION = "What is a qubit?"
+
+
+async def warmup():
+    """Pre-warm external connections so the first user skips cold-start costs."""
+    try:
+        # Voyage embed and Groq handshake in parallel, then one vector
+        # search to warm the pool connection and cached query plan
+        embedding, _ = await asyncio.gather(
+            retriever.embed_query(WARMUP_QUESTION),
+            get_groq().client.models.list()
+        )
+        semantic_cache.put_embedding(WARMUP_QUESTION, embedding)
+        await retriever.search(WARMUP_QUESTION, top_k=1, embedding=embedding)
+        text_similarity("warm", "up")
+        logger.info("Warmup complete")
+    except Exception as e:
+        logger.warning(f"Warmup failed (continuing): {e}")
 
 
 @asynccontextmanager
@@ -100,15 +184,21 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Quantum Computing LLM API...")
     validate_config()
     retriever = Retriever()
+    await retriever.connect()
+    await warmup()
     logger.info("Ready")
     yield
+    await retriever.close()
+    if modal_inference is not None:
+        await modal_inference.aclose()
     logger.info("Shutdown")
 
 
 app = FastAPI(
     title="Quantum Computing LLM API",
     version="4.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 
@@ -151,50 +241,156 @@ async def favicon():
 
 
 @app.post("/query", response_model=QueryResponse)
-async def query(request: QueryRequest):
+async def query(request: QueryRequest, http_request: Request, response: Response):
     """Process a question and return an answer."""
     if not request.question.strip():
         raise HTTPException(status_code=400, detail="Question cannot be empty")
-    
+
     start = time.time()
-    
-    # Retrieve context
-    results = retriever.search(request.question, top_k=5)
-    if not results:
-        raise HTTPException(status_code=404, detail="No relevant context found")
-    
-    context = build_context(results, top_k=3)
-    
-    # Select model and generate
-    if request.model == "custom":
-        modal = get_modal()
-        if not modal:
-            raise HTTPException(status_code=400, detail="Custom model not configured")
-        logger.info("Using Custom Model (Modal)")
-        llm = modal
-        model_used = "custom"
-    else:
-        logger.info("Using Groq")
-        llm = get_groq()
-        model_used = "groq"
-    
-    answer = llm.generate(context, request.question)
-    suggested = get_suggested_question(request.question, answer, results)
-    elapsed_ms = int((time.time() - start) * 1000)
-    
-    sources = [
-        Source(
-            question=r["question"][:100],
-            source=r["source"],
-            similarity=round(r["similarity"], 4)
+
+    etag = make_etag(request.model, request.question)
+    if http_request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+    # Exact repeat: serve the cached body without touching the pipeline
+    http_cached = etag_cache.get(etag)
+    if http_cached is not None:
+        logger.info("ETag cache hit")
+        return QueryResponse(
+            **http_cached,
+            response_time_ms=int((time.time() - start) * 1000)
         )
-        for r in results[:3]
-    ]
-    
+
+    # Coalesce: duplicates of an in-flight question await the same result
+    pending = inflight.get(etag)
+    if pending is not None:
+        logger.info("Coalesced duplicate in-flight query")
+        payload = await pending
+    else:
+        future = asyncio.get_running_loop().create_future()
+        inflight[etag] = future
+        try:
+            payload = await run_query_pipeline(request.question, request.model, etag)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved even with no waiters
+            raise
+        else:
+            future.set_result(payload)
+        finally:
+            del inflight[etag]
+
     return QueryResponse(
-        answer=answer,
-        sources=sources,
-        response_time_ms=elapsed_ms,
-        suggested_question=suggested,
-        model_used=model_used
+        **payload,
+        response_time_ms=int((time.time() - start) * 1000)
     )
+
+
+async def run_query_pipeline(question: str, model: str, etag: str) -> dict:
+    """Run the embed/retrieve/generate pipeline for a single question."""
+    llm, model_used = select_model(model)
+
+    # Embed (cached for exact repeat questions)
+    embedding = await get_query_embedding(question)
+
+    # Semantic cache hit: skip retrieval and generation entirely
+    cached = semantic_cache.lookup(embedding, model_used)
+    if cached is not None:
+        logger.info("Semantic cache hit")
+        payload = {**cached, "model_used": model_used}
+        etag_cache[etag] = payload
+        return payload
+
+    # Retrieve context, building the context string and sources in one pass
+    results, context, sources = await retriever.search_with_context(
+        question, top_k_search=5, top_k_context=3, embedding=embedding
+    )
+    if not results:
+        raise HTTPException(status_code=404, detail="No relevant context found")
+
+    answer = await llm.generate(context, question)
+    suggested = get_suggested_question(question, answer, results)
+
+    semantic_cache.store(embedding, model_used, {
+        "answer": answer,
+        "sources": sources,
+        "suggested_question": suggested
+    })
+    payload = {
+        "answer": answer,
+        "sources": sources,
+        "suggested_question": suggested,
+        "model_used": model_used
+    }
+    etag_cache[etag] = payload
+    return payload
+
+
+@app.post("/query/stream")
+async def query_stream(request: QueryRequest):
+    """Process a question, streaming the answer as server-sent events.
+
+    Emits {"delta": ...} events while the answer is generated, then a
+    final {"done": true, ...} event carrying sources, response time and
+    the suggested follow-up question.
+    """
+    if not request.question.strip():
+        raise HTTPException(status_code=400, detail="Question cannot be empty")
+
+    start = time.time()
+
+    llm, model_used = select_model(request.model)
+    embedding = await get_query_embedding(request.question)
+
+    cached = semantic_cache.lookup(embedding, model_used)
+    if cached is None:
+        results, context, sources = await retriever.search_with_context(
+            request.question, top_k_search=5, top_k_context=3, embedding=embedding
+        )
+        if not results:
+            raise HTTPException(status_code=404, detail="No relevant context found")
+
+    async def event_stream():
+        if cached is not None:
+            logger.info("Semantic cache hit")
+            yield sse_event({"delta": cached["answer"]})
+            yield sse_event({
+                "done": True,
+                "sources": cached["sources"],
+                "response_time_ms": int((time.time() - start) * 1000),
+                "suggested_question": cached["suggested_question"],
+                "model_used": model_used
+            })
+            return
+
+        parts = []
+        try:
+            async for delta in llm.generate_stream(context, request.question):
+                parts.append(delta)
+                yield sse_event({"delta": delta})
+        except RuntimeError as e:
+            # Response already started; surface the failure as an event
+            yield sse_event({"error": str(e)})
+            return
+
+        answer = "".join(parts).strip()
+        suggested = get_suggested_question(request.question, answer, results)
+
+        semantic_cache.store(embedding, model_used, {
+            "answer": answer,
+            "sources": sources,
+            "suggested_question": suggested
+        })
+
+        yield sse_event({
+            "done": True,
+            "sources": sources,
+            "response_time_ms": int((time.time() - start) * 1000),
+            "suggested_question": suggested,
+            "model_used": model_used
+        })
+
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
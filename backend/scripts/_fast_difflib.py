@@ -0,0 +1,77 @@
+"""SequenceMatcher with a cached, range-filtered b2j index.
+
+Vendored fallback for when RapidFuzz cannot be installed: backports the
+post-3.12 CPython difflib optimization where b2j is filtered once per
+(blo, bhi) window and cached, so the find_longest_match inner loop drops
+its per-hit `j < blo` / `j >= bhi` range checks.
+"""
+
+from difflib import Match, SequenceMatcher
+
+__all__ = ["FastSequenceMatcher"]
+
+
+class FastSequenceMatcher(SequenceMatcher):
+    """Drop-in SequenceMatcher with a faster find_longest_match."""
+
+    def __init__(self, isjunk=None, a='', b='', autojunk=True):
+        self._b2j_cache = {}
+        super().__init__(isjunk, a, b, autojunk)
+
+    def set_seq2(self, b):
+        self._b2j_cache = {}
+        super().set_seq2(b)
+
+    def find_longest_match(self, alo=0, ahi=None, blo=0, bhi=None):
+        """Find longest matching block in a[alo:ahi] and b[blo:bhi]."""
+        a, b = self.a, self.b
+        if ahi is None:
+            ahi = len(a)
+        if bhi is None:
+            bhi = len(b)
+
+        # Filter b2j to the window once and cache it; repeated calls with
+        # the same window (the common recursive pattern) skip both the
+        # filtering and the range checks inside the hot loop
+        key = (blo, bhi)
+        b2j = self._b2j_cache.get(key)
+        if b2j is None:
+            if blo == 0 and bhi == len(b):
+                b2j = self.b2j
+            else:
+                b2j = {
+                    elt: [j for j in indices if blo <= j < bhi]
+                    for elt, indices in self.b2j.items()
+                }
+            self._b2j_cache[key] = b2j
+
+        besti, bestj, bestsize = alo, blo, 0
+        j2len = {}
+        nothing = []
+        for i in range(alo, ahi):
+            j2lenget = j2len.get
+            newj2len = {}
+            for j in b2j.get(a[i], nothing):
+                k = newj2len[j] = j2lenget(j - 1, 0) + 1
+                if k > bestsize:
+                    besti, bestj, bestsize = i - k + 1, j - k + 1, k
+            j2len = newj2len
+
+        # Extend over junk/non-junk boundaries exactly as difflib does
+        isbjunk = self.bjunk.__contains__
+        while besti > alo and bestj > blo and \
+                not isbjunk(b[bestj - 1]) and a[besti - 1] == b[bestj - 1]:
+            besti, bestj, bestsize = besti - 1, bestj - 1, bestsize + 1
+        while besti + bestsize < ahi and bestj + bestsize < bhi and \
+                not isbjunk(b[bestj + bestsize]) and \
+                a[besti + bestsize] == b[bestj + bestsize]:
+            bestsize += 1
+        while besti > alo and bestj > blo and \
+                isbjunk(b[bestj - 1]) and a[besti - 1] == b[bestj - 1]:
+            besti, bestj, bestsize = besti - 1, bestj - 1, bestsize + 1
+        while besti + bestsize < ahi and bestj + bestsize < bhi and \
+                isbjunk(b[bestj + bestsize]) and \
+                a[besti + bestsize] == b[bestj + bestsize]:
+            bestsize += 1
+
+        return Match(besti, bestj, bestsize)
@@ -0,0 +1,93 @@
+"""Embedding request batcher for Quantum Computing RAG."""
+
+import asyncio
+import logging
+from typing import List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAX_BATCH_SIZE = 8
+MAX_WAIT_SECONDS = 0.01
+
+
+class EmbeddingBatcher:
+    """Coalesces concurrent embed requests into single Voyage calls.
+
+    Callers submit a text and await its embedding; a background task
+    drains the queue in small time windows and issues one batched
+    voyage.embed call for everything that arrived together.
+    """
+
+    def __init__(
+        self,
+        voyage,
+        model: str,
+        output_dtype: str = "float",
+        output_dimension: int = 1024,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        max_wait: float = MAX_WAIT_SECONDS
+    ):
+        self.voyage = voyage
+        self.model = model
+        self.output_dtype = output_dtype
+        self.output_dimension = output_dimension
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.queue: asyncio.Queue = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        """Start the background batching task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Cancel the background batching task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def submit(self, text: str) -> List[float]:
+        """Queue a text for embedding and await its result."""
+        if self._task is None:
+            self.start()
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((text, future))
+        return await future
+
+    async def _run(self):
+        while True:
+            batch = [await self.queue.get()]
+            # Collect whatever else arrives within the wait window
+            while len(batch) < self.max_batch_size:
+                try:
+                    item = await asyncio.wait_for(self.queue.get(), timeout=self.max_wait)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(item)
+            await self._embed_batch(batch)
+
+    async def _embed_batch(self, batch: List[Tuple[str, asyncio.Future]]):
+        texts = [text for text, _ in batch]
+        try:
+            result = await self.voyage.embed(
+                texts=texts,
+                model=self.model,
+                input_type="query",
+                output_dtype=self.output_dtype,
+                output_dimension=self.output_dimension
+            )
+        except Exception as e:
+            logger.error(f"Batched embed failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(RuntimeError(f"Embedding failed: {e}"))
+            return
+
+        for (_, future), embedding in zip(batch, result.embeddings):
+            if not future.done():
+                future.set_result(embedding)
@@ -1,18 +1,23 @@
 """Groq API inference for Quantum Computing LLM."""
 
 import logging
-from groq import Groq
+from typing import AsyncGenerator
+
+from groq import AsyncGroq
+from cachetools import LRUCache
 
 logger = logging.getLogger(__name__)
 
-SYSTEM_PROMPT = """You are a quantum computing assistant for beginners. 
+CACHE_SIZE = 128
+
+SYSTEM_PROMPT = """You are a quantum computing assistant for beginners.
 Answer using the provided context. Keep explanations simple and accessible.
 Do not use complex math or equations. Be concise but thorough."""
 
 
 class GroqInference:
     """Groq API client for LLM inference."""
-    
+
     def __init__(
         self,
         api_key: str,
@@ -20,24 +25,69 @@ class GroqInference:
         temperature: float = 0.2,
         max_tokens: int = 300
     ):
-        self.client = Groq(api_key=api_key)
+        self.client = AsyncGroq(api_key=api_key)
         self.model = model
         self.temperature = temperature
         self.max_tokens = max_tokens
-    
-    def generate(self, context: str, question: str) -> str:
+        self._cache: LRUCache = LRUCache(maxsize=CACHE_SIZE)
+
+    async def generate(self, context: str, question: str) -> str:
         """Generate an answer given context and question."""
+        key = hash((context, question))
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    # Question before context: the stable part of the prompt
+                    # comes first, which is what provider prefix caching wants
+                    {"role": "user", "content": f"Question: {question}\n\nContext:\n{context}"}
+                ],
+                temperature=self.temperature,
+                max_tokens=self.max_tokens,
+                seed=0
+            )
+            answer = response.choices[0].message.content.strip()
+            self._cache[key] = answer
+            return answer
+        except Exception as e:
+            logger.error(f"Groq API error: {e}")
+            raise RuntimeError(f"Failed to generate response: {e}")
+
+    async def generate_stream(
+        self, context: str, question: str
+    ) -> AsyncGenerator[str, None]:
+        """Stream answer tokens as they are generated."""
+        key = hash((context, question))
+        cached = self._cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+        parts = []
         try:
-            response = self.client.chat.completions.create(
+            stream = await self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": SYSTEM_PROMPT},
-                    {"role": "user", "content": f"Context:\n{context}\n\nQuestion: {question}"}
+                    {"role": "user", "content": f"Question: {question}\n\nContext:\n{context}"}
                 ],
                 temperature=self.temperature,
-                max_tokens=self.max_tokens
+                max_tokens=self.max_tokens,
+                seed=0,
+                stream=True
             )
-            return response.choices[0].message.content.strip()
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    delta = chunk.choices[0].delta.content
+                    parts.append(delta)
+                    yield delta
         except Exception as e:
             logger.error(f"Groq API error: {e}")
             raise RuntimeError(f"Failed to generate response: {e}")
+
+        self._cache[key] = "".join(parts).strip()
@@ -1,32 +1,40 @@
 """Modal API inference for Quantum Computing LLM."""
 
 import logging
-import requests
+import httpx
 
 logger = logging.getLogger(__name__)
 
 
 class ModalInference:
     """Modal API client for custom model inference."""
-    
+
     def __init__(self, url: str, timeout: int = 300):
         self.url = url
         self.timeout = timeout
-    
-    def generate(self, context: str, question: str) -> str:
+        self.client = httpx.AsyncClient(timeout=timeout)
+
+    async def generate(self, context: str, question: str) -> str:
         """Generate an answer by calling Modal API."""
         try:
-            response = requests.post(
+            response = await self.client.post(
                 self.url,
-                json={"context": context, "question": question},
-                timeout=self.timeout
+                json={"context": context, "question": question}
             )
             response.raise_for_status()
             data = response.json()
             return data.get("answer", "")
-        except requests.Timeout:
+        except httpx.TimeoutException:
             logger.error("Modal API timeout")
             raise RuntimeError("Custom model request timed out")
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             logger.error(f"Modal API error: {e}")
             raise RuntimeError(f"Failed to connect to custom model: {e}")
+
+    async def generate_stream(self, context: str, question: str):
+        """Yield the full answer once; the Modal endpoint does not stream."""
+        yield await self.generate(context, question)
+
+    async def aclose(self):
+        """Close the underlying HTTP client."""
+        await self.client.aclose()
@@ -1,65 +1,139 @@
 """Retrieval module for Quantum Computing RAG."""
 
 import os
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from dotenv import load_dotenv
 import voyageai
-import psycopg2
+import asyncpg
+from pgvector.asyncpg import register_vector
 
-load_dotenv()
+from embedding_batcher import EmbeddingBatcher
+
+# Skip re-parsing .env when app.config already loaded it
+if os.getenv("_ENV_LOADED") != "1":
+    load_dotenv()
+    os.environ["_ENV_LOADED"] = "1"
 
 EMBEDDING_MODEL = "voyage-3.5-lite"
 
+# Quantized embeddings cut Voyage transport bytes 4x (int8) and speed up
+# distance computations; cosine is scale-invariant so the <=> search is
+# unchanged. Must match how the chunks table was embedded.
+EMBEDDING_OUTPUT_DTYPE = os.getenv("EMBEDDING_OUTPUT_DTYPE", "float")
+EMBEDDING_OUTPUT_DIMENSION = int(os.getenv("EMBEDDING_OUTPUT_DIMENSION", "1024"))
+
+# Bound HNSW candidate-list size so search latency stays predictable
+HNSW_EF_SEARCH = 40
+
+# Single $1 so asyncpg prepares one statement and sends the vector once
+SEARCH_SQL = """
+    SELECT source, question, answer, 1 - (embedding <=> $1) as similarity
+    FROM chunks
+    ORDER BY embedding <=> $1
+    LIMIT $2
+"""
+
+
+async def _init_connection(conn):
+    """Register the pgvector codec so embeddings travel as binary."""
+    await register_vector(conn)
+
 
 class Retriever:
     """RAG retriever using Voyage AI embeddings and Neon PostgreSQL."""
-    
+
     def __init__(self):
         self.api_key = os.getenv("VOYAGE_API_KEY")
         self.db_url = os.getenv("DATABASE_URL")
-        
+
         if not self.api_key:
             raise ValueError("VOYAGE_API_KEY not found")
         if not self.db_url:
             raise ValueError("DATABASE_URL not found")
-        
-        self.voyage = voyageai.Client(api_key=self.api_key)
-    
-    def embed_query(self, query: str) -> List[float]:
-        """Generate embedding for a query."""
-        result = self.voyage.embed(
-            texts=[query],
-            model=EMBEDDING_MODEL,
-            input_type="query"
+
+        self.voyage = voyageai.AsyncClient(api_key=self.api_key)
+        self.batcher = EmbeddingBatcher(
+            self.voyage,
+            EMBEDDING_MODEL,
+            output_dtype=EMBEDDING_OUTPUT_DTYPE,
+            output_dimension=EMBEDDING_OUTPUT_DIMENSION
+        )
+        self.pool: Optional[asyncpg.Pool] = None
+
+    async def connect(self):
+        """Open the connection pool. Call once on application startup."""
+        self.pool = await asyncpg.create_pool(
+            self.db_url, min_size=1, max_size=10, init=_init_connection
         )
-        return result.embeddings[0]
-    
-    def search(self, query: str, top_k: int = 5) -> List[Dict]:
+        self.batcher.start()
+
+    async def close(self):
+        """Close the connection pool. Call once on application shutdown."""
+        await self.batcher.stop()
+        if self.pool is not None:
+            await self.pool.close()
+            self.pool = None
+
+    async def embed_query(self, query: str) -> List[float]:
+        """Generate embedding for a query via the shared batcher."""
+        return await self.batcher.submit(query)
+
+    async def search(
+        self,
+        query: str,
+        top_k: int = 5,
+        embedding: Optional[List[float]] = None
+    ) -> List[Dict]:
         """Search for similar Q&A pairs."""
-        embedding = self.embed_query(query)
-        
-        conn = psycopg2.connect(self.db_url)
-        cur = conn.cursor()
-        
-        try:
-            cur.execute("""
-                SELECT source, question, answer, 1 - (embedding <=> %s::vector) as similarity
-                FROM chunks
-                ORDER BY embedding <=> %s::vector
-                LIMIT %s
-            """, (embedding, embedding, top_k))
-            
-            results = [
-                {
-                    "source": row[0],
-                    "question": row[1],
-                    "answer": row[2],
-                    "similarity": float(row[3])
-                }
-                for row in cur.fetchall()
-            ]
-        finally:
-            cur.close()
-            conn.close()
-        
+        results, _, _ = await self.search_with_context(
+            query, top_k_search=top_k, embedding=embedding
+        )
         return results
+
+    async def search_with_context(
+        self,
+        query: str,
+        top_k_search: int = 5,
+        top_k_context: int = 3,
+        embedding: Optional[List[float]] = None
+    ) -> Tuple[List[Dict], str, List[Dict]]:
+        """Search and build the context string and source entries in one pass."""
+        if embedding is None:
+            embedding = await self.embed_query(query)
+
+        if self.pool is None:
+            await self.connect()
+
+        # asyncpg caches prepared statements per connection, so Neon
+        # reuses the query plan across requests.
+        async with self.pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(f"SET LOCAL hnsw.ef_search = {HNSW_EF_SEARCH}")
+                rows = await conn.fetch(SEARCH_SQL, embedding, top_k_search)
+
+        results = []
+        context_parts = []
+        sources = []
+
+        for i, row in enumerate(rows):
+            question_trimmed = row["question"][:100]
+            answer_trimmed = row["answer"][:300]
+            similarity = float(row["similarity"])
+
+            results.append({
+                "source": row["source"],
+                "question": row["question"],
+                "question_trimmed": question_trimmed,
+                "answer": row["answer"],
+                "answer_trimmed": answer_trimmed,
+                "similarity": similarity
+            })
+            if i < top_k_context:
+                context_parts.append(f"Q: {question_trimmed} A: {answer_trimmed}")
+                sources.append({
+                    "question": question_trimmed,
+                    "source": row["source"],
+                    "similarity": round(similarity, 4)
+                })
+
+        return results, " ".join(context_parts), sources
@@ -0,0 +1,75 @@
+"""Semantic cache for Quantum Computing RAG queries."""
+
+import logging
+from typing import List, Dict, Optional
+
+import numpy as np
+from cachetools import LRUCache
+
+logger = logging.getLogger(__name__)
+
+SIMILARITY_THRESHOLD = 0.95
+MAX_ENTRIES = 256
+
+
+class SemanticCache:
+    """In-process cache of query embeddings and final answers.
+
+    Two layers: an LRU of normalized question -> embedding that skips the
+    Voyage embed call for exact repeats, and a list of answered entries
+    matched by cosine similarity that skips retrieval and generation for
+    paraphrased repeats.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = MAX_ENTRIES,
+        threshold: float = SIMILARITY_THRESHOLD
+    ):
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.embeddings: LRUCache = LRUCache(maxsize=max_entries)
+        self.entries: List[Dict] = []
+        self._matrix: Optional[np.ndarray] = None
+
+    @staticmethod
+    def normalize(question: str) -> str:
+        """Normalize a question for exact-match lookup."""
+        return " ".join(question.lower().split())
+
+    def get_embedding(self, question: str) -> Optional[List[float]]:
+        """Return a cached embedding for an exact (normalized) repeat."""
+        return self.embeddings.get(self.normalize(question))
+
+    def put_embedding(self, question: str, embedding: List[float]):
+        """Cache the embedding for a question."""
+        self.embeddings[self.normalize(question)] = embedding
+
+    def lookup(self, embedding: List[float], model: str) -> Optional[Dict]:
+        """Return a cached response if a same-model entry is similar enough."""
+        if self._matrix is None:
+            return None
+
+        q = np.asarray(embedding, dtype=np.float32)
+        q /= np.linalg.norm(q)
+        sims = self._matrix @ q
+
+        # Only consider entries answered by the requested model
+        mask = np.array([e["model"] == model for e in self.entries])
+        sims = np.where(mask, sims, -1.0)
+
+        best = int(np.argmax(sims))
+        if sims[best] < self.threshold:
+            return None
+        return self.entries[best]["response"]
+
+    def store(self, embedding: List[float], model: str, response: Dict):
+        """Add an answered query to the cache."""
+        vector = np.asarray(embedding, dtype=np.float32)
+        vector /= np.linalg.norm(vector)
+
+        self.entries.append({"vector": vector, "model": model, "response": response})
+        if len(self.entries) > self.max_entries:
+            self.entries.pop(0)
+
+        self._matrix = np.vstack([e["vector"] for e in self.entries])
@@ -1,57 +1,119 @@
-"""Flask frontend for Quantum Computing LLM."""
+"""Quart frontend for Quantum Computing LLM."""
 
 import os
 import logging
-from flask import Flask, render_template, request, jsonify
-import requests
+from quart import Quart, Response, render_template, request
+import httpx
+import orjson
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = Flask(__name__)
+app = Quart(__name__)
 BACKEND_URL = os.getenv("BACKEND_URL", "http://localhost:8000")
 
+# Shared async client: keep-alive connections to the backend, and no
+# worker thread blocked while the backend generates
+CLIENT = httpx.AsyncClient(
+    base_url=BACKEND_URL,
+    limits=httpx.Limits(max_connections=50, max_keepalive_connections=10)
+)
+
+
+def json_response(payload, status=200):
+    """Serialize with orjson instead of stdlib json-backed jsonify."""
+    return Response(orjson.dumps(payload), status=status, mimetype="application/json")
+
+
+@app.after_serving
+async def shutdown():
+    """Close the shared HTTP client."""
+    await CLIENT.aclose()
+
 
 @app.route("/")
-def index():
+async def index():
     """Serve main page."""
-    return render_template("index.html")
+    return await render_template("index.html")
 
 
 @app.route("/api/query", methods=["POST"])
-def query():
+async def query():
     """Proxy query to backend."""
     try:
-        response = requests.post(
-            f"{BACKEND_URL}/query",
-            json=request.get_json(),
+        response = await CLIENT.post(
+            "/query",
+            json=await request.get_json(),
             timeout=300
         )
-        return jsonify(response.json()), response.status_code
-    except requests.Timeout:
-        return jsonify({"error": "Request timed out. Please try again."}), 504
-    except requests.ConnectionError:
-        return jsonify({"error": "Cannot connect to backend."}), 503
+        # Relay the backend's JSON bytes without a decode/encode round-trip
+        return Response(
+            response.content,
+            status=response.status_code,
+            mimetype="application/json"
+        )
+    except httpx.TimeoutException:
+        return json_response({"error": "Request timed out. Please try again."}, 504)
+    except httpx.ConnectError:
+        return json_response({"error": "Cannot connect to backend."}, 503)
     except Exception as e:
         logger.error(f"Query error: {e}")
-        return jsonify({"error": str(e)}), 500
+        return json_response({"error": str(e)}, 500)
+
+
+@app.route("/api/query/stream", methods=["POST"])
+async def query_stream():
+    """Proxy streaming query to backend, relaying SSE lines."""
+    payload = await request.get_json()
+    try:
+        upstream_request = CLIENT.build_request(
+            "POST", "/query/stream", json=payload, timeout=300
+        )
+        upstream = await CLIENT.send(upstream_request, stream=True)
+    except httpx.TimeoutException:
+        return json_response({"error": "Request timed out. Please try again."}, 504)
+    except httpx.ConnectError:
+        return json_response({"error": "Cannot connect to backend."}, 503)
+
+    if upstream.status_code != 200:
+        body = await upstream.aread()
+        await upstream.aclose()
+        return Response(body, status=upstream.status_code, mimetype="application/json")
+
+    async def relay():
+        try:
+            async for line in upstream.aiter_lines():
+                if line:
+                    yield line + "\n\n"
+        finally:
+            await upstream.aclose()
+
+    response = Response(relay(), mimetype="text/event-stream")
+    # Disable Quart's 60 s response timeout: custom-model streams can
+    # run well past it and would be silently truncated mid-stream
+    response.timeout = None
+    return response
 
 
 @app.route("/api/health", methods=["GET"])
-def api_health():
+async def api_health():
     """Proxy health check to backend."""
     try:
-        response = requests.get(f"{BACKEND_URL}/health", timeout=5)
-        return jsonify(response.json()), response.status_code
+        response = await CLIENT.get("/health", timeout=5)
+        return Response(
+            response.content,
+            status=response.status_code,
+            mimetype="application/json"
+        )
     except Exception as e:
         logger.error(f"Health check error: {e}")
-        return jsonify({"error": "Backend unavailable"}), 503
+        return json_response({"error": "Backend unavailable"}, 503)
 
 
 @app.route("/health", methods=["GET"])
-def health():
+async def health():
     """Frontend health check."""
-    return jsonify({"status": "ok"}), 200
+    return json_response({"status": "ok"})
 
 
 if __name__ == "__main__":
@@ -255,29 +255,81 @@ async function sendQuestion(question, isRetry = false) {
     try {
         const controller = new AbortController();
         const timeoutId = setTimeout(() => controller.abort(), timeout);
-        
-        const response = await fetch('/api/query', {
+
+        const response = await fetch('/api/query/stream', {
             method: 'POST',
             headers: { 'Content-Type': 'application/json' },
-            body: JSON.stringify({ 
+            body: JSON.stringify({
                 question,
                 model: selectedModel
             }),
             signal: controller.signal
         });
-        
+
+        const contentType = response.headers.get('content-type') || '';
+        if (!response.ok || !contentType.includes('text/event-stream')) {
+            clearTimeout(timeoutId);
+            const data = await response.json();
+            loadingEl.remove();
+            stopPipelineAnimation();
+            addMessage('error', data.error || data.detail || 'Something went wrong.', true);
+            return;
+        }
+
+        // Read SSE events: {delta} chunks, then a final {done} with metadata
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        let answer = '';
+        let streamEl = null;
+        let meta = null;
+        let streamError = null;
+
+        while (true) {
+            const { done, value } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+
+            const events = buffer.split('\n\n');
+            buffer = events.pop();
+
+            for (const event of events) {
+                const line = event.trim();
+                if (!line.startsWith('data:')) continue;
+                const data = JSON.parse(line.slice(5));
+
+                if (data.error) {
+                    streamError = data.error;
+                    break;
+                }
+                if (data.delta) {
+                    if (!streamEl) {
+                        // First token arrived: swap loading for the answer bubble
+                        loadingEl.remove();
+                        stopPipelineAnimation();
+                        clearTimeout(timeoutId);
+                        streamEl = addStreamingMessage();
+                    }
+                    answer += data.delta;
+                    streamEl.content.textContent = answer;
+                    scrollToBottom();
+                }
+                if (data.done) meta = data;
+            }
+            if (streamError) break;
+        }
+
         clearTimeout(timeoutId);
-        const data = await response.json();
-        loadingEl.remove();
+        if (loadingEl.parentElement) loadingEl.remove();
         stopPipelineAnimation();
 
-        if (response.ok) {
-            // Update activity time on success
-            lastActivityTime = Date.now();
-            addMessage('ai', data.answer, data.response_time_ms, data.suggested_question, data.model_used);
-        } else {
-            addMessage('error', data.error || 'Something went wrong.', true);
+        if (streamError || !meta) {
+            addMessage('error', streamError || 'Stream ended unexpectedly. Please try again.', true);
+            return;
         }
+
+        lastActivityTime = Date.now();
+        finalizeStreamingMessage(streamEl, meta);
     } catch (error) {
         loadingEl.remove();
         stopPipelineAnimation();
@@ -426,6 +478,50 @@ function stopPipelineAnimation() {
 // =============================================================================
 // MESSAGE FUNCTIONS
 // =============================================================================
+function addStreamingMessage() {
+    const div = document.createElement('div');
+    div.className = 'message message--ai';
+    const content = document.createElement('div');
+    content.className = 'message__content';
+    div.appendChild(content);
+    messages.appendChild(div);
+    scrollToBottom();
+    return { div, content };
+}
+
+function finalizeStreamingMessage(streamEl, meta) {
+    const { div } = streamEl;
+
+    if (meta.response_time_ms || meta.model_used) {
+        const metaDiv = document.createElement('div');
+        metaDiv.className = 'message__meta';
+
+        let metaText = '';
+        if (meta.response_time_ms) {
+            metaText += `${(meta.response_time_ms / 1000).toFixed(1)}s`;
+        }
+        if (meta.model_used) {
+            metaText += metaText ? ` · ${meta.model_used}` : meta.model_used;
+        }
+        metaDiv.textContent = metaText;
+        div.appendChild(metaDiv);
+    }
+
+    if (meta.suggested_question) {
+        const suggestedDiv = document.createElement('div');
+        suggestedDiv.className = 'suggested';
+        const btn = document.createElement('button');
+        btn.className = 'suggested__button';
+        btn.textContent = meta.suggested_question;
+        btn.onclick = () => { suggestedDiv.style.display = 'none'; sendQuestion(meta.suggested_question); };
+        suggestedDiv.appendChild(btn);
+        div.appendChild(suggestedDiv);
+    }
+
+    scrollToBottom();
+    pauseVideo();
+}
+
 function addMessage(type, content, responseTime = null, suggestedQuestion = null, modelUsed = null) {
     const div = document.createElement('div');
     div.className = `message message--${type}`;